@@ -0,0 +1,36 @@
+"""
+AJT Field Helpers
+
+Cheap generators for the two per-record AJT fields that are costly to
+build naively: timestamp and run_id. Shared by the Python examples.
+Standard library only.
+"""
+
+import itertools
+import time
+from uuid import uuid4
+
+# Per-process run_id prefix: the first four groups of a real uuid4
+# (8-4-4-4, incl. version and variant bits); a counter fills the
+# 12-digit node group.
+_RUN_ID_PREFIX = str(uuid4())[:24]
+_run_counter = itertools.count()
+
+# (second, "YYYY-MM-DDTHH:MM:SS") - refreshed at most once per second
+_ts_cache = (None, "")
+
+
+def new_run_id() -> str:
+    """Return a uuid-formatted id without a urandom read per call."""
+    return f"{_RUN_ID_PREFIX}{next(_run_counter):012x}"
+
+
+def utc_timestamp() -> str:
+    """Return the current UTC time as ISO-8601 with microseconds."""
+    global _ts_cache
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _ts_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _ts_cache = (second, prefix)
+    return f"{prefix}.{nanos // 1000:06d}+00:00"
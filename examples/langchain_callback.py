@@ -7,22 +7,208 @@ to an existing LangChain application with ZERO runtime enforcement.
 Key points:
 - Decision and risk values come from YOUR policy engine (not AJT)
 - AJT only structures the log - it doesn't make decisions
-- No performance impact (async logging recommended for production)
+- Logging is queued and written by a background writer thread
 - Compatible with any LangChain model
 """
 
+import asyncio
+import atexit
+import json
 import logging
-from datetime import datetime, timezone
+import queue
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
-from langchain.callbacks.base import BaseCallbackHandler
+from langchain.callbacks.base import AsyncCallbackHandler, BaseCallbackHandler
 from langchain.schema import LLMResult
 
+from ajt_fields import utc_timestamp
+
 # Configure logging (use your production logger)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("ajt")
 
+# Concurrent chains (thread-per-request servers) would all contend on
+# one handler lock. Instead each thread puts LogRecords on its own
+# queue, and a single writer thread drains them all straight into the
+# handlers basicConfig installed.
+_WRITER_INTERVAL_S = 0.05
+
+_sink_handlers = list(logging.getLogger().handlers)
+_thread_queues: Dict[threading.Thread, queue.SimpleQueue] = {}
+_thread_queues_lock = threading.Lock()  # taken once per new thread
+_local = threading.local()
+_stop_writer = threading.Event()
+
+
+def _thread_queue() -> queue.SimpleQueue:
+    """Return the calling thread's queue, registering it on first use."""
+    q = getattr(_local, "queue", None)
+    if q is None:
+        q = _local.queue = queue.SimpleQueue()
+        with _thread_queues_lock:
+            _thread_queues[threading.current_thread()] = q
+    return q
+
+
+def _emit(msg: str) -> None:
+    """
+    Queue an already-serialized line as an INFO record.
 
-class AJTCallbackHandler(BaseCallbackHandler):
+    Skips logger.info()'s findCaller() stack walk and the logger's
+    filter/handler dispatch; callers check the level themselves.
+    """
+    _thread_queue().put(
+        logging.LogRecord(logger.name, logging.INFO, "", 0, msg, None, None)
+    )
+
+
+class _ThreadQueueHandler(logging.Handler):
+    """Send the logger's other records (e.g. errors) through the writer too."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        _thread_queue().put(record)
+
+
+logger.addHandler(_ThreadQueueHandler())
+logger.propagate = False
+
+
+def _drain_thread_queues() -> None:
+    """
+    Merge every thread's pending records and write them to the sinks.
+
+    Records are sorted by creation time within one drain only; a record
+    created before a drain but queued after it comes out in the next.
+    Only this thread writes, so the sink handlers' locks are uncontended.
+    """
+    with _thread_queues_lock:
+        pending = list(_thread_queues.items())
+
+    batch = []
+    for thread, q in pending:
+        finished = not thread.is_alive()
+        while True:
+            try:
+                batch.append(q.get_nowait())
+            except queue.Empty:
+                break
+        if finished:
+            # Nothing can be added after the thread exited
+            with _thread_queues_lock:
+                del _thread_queues[thread]
+
+    batch.sort(key=lambda record: record.created)
+    for record in batch:
+        for handler in _sink_handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+def _write_periodically() -> None:
+    while not _stop_writer.wait(_WRITER_INTERVAL_S):
+        _drain_thread_queues()
+
+
+def _stop_writer_thread() -> None:
+    """Stop the writer and write whatever is still queued."""
+    _stop_writer.set()
+    _writer.join()
+    _drain_thread_queues()
+
+
+_writer = threading.Thread(
+    target=_write_periodically, name="ajt-writer", daemon=True
+)
+_writer.start()
+# Registered after logging's own shutdown hook, so atexit runs it first
+atexit.register(_stop_writer_thread)
+
+
+# Built once and reused for every record
+_encode = json.JSONEncoder(ensure_ascii=False).encode
+
+class _AJTRecordMixin:
+    """Shared constructor and record emission for the AJT handlers."""
+
+    def __init__(
+        self,
+        policy_engine: Any,  # YOUR policy decision logic
+        session_id: str,
+        app_version: str = "1.0.0"
+    ):
+        self.policy_engine = policy_engine
+        self.session_id = session_id
+        self.app_version = app_version
+
+        # Fields fixed for the handler's lifetime, serialized once
+        # (create a new handler if YOUR policy version changes)
+        self._static_fields = _encode({
+            "policy_version": policy_engine.version,
+            "app_version": app_version,
+            "session_id": session_id
+        })[1:-1]
+
+    def _log_record(
+        self,
+        serialized: Dict[str, Any],
+        policy_result: Dict[str, Any],
+        run_id: Any,
+        timestamp: str
+    ) -> None:
+        # The policy engine has already run; only the log is optional
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        # Extract model info
+        model_name = serialized.get("id", ["unknown"])[-1]
+
+        # Construct the per-call part of the AJT log record
+        ajt_record = {
+            "timestamp": timestamp,  # Taken when on_llm_start was called
+            "run_id": str(run_id),
+            "model": model_name,
+            "decision": policy_result["decision"],  # From YOUR engine
+            "risk_level": policy_result["risk"],    # From YOUR engine
+            "human_in_loop": policy_result.get("human_required", False)
+        }
+
+        # Log as structured JSON (use structured logger in production);
+        # the invariant fields are spliced in before the closing brace
+        _emit(f"{_encode(ajt_record)[:-1]}, {self._static_fields}}}")
+
+
+# Opt-in background evaluation (AJTCallbackHandler(background=True)).
+# One pool for all handlers: handlers are usually one per session, so
+# per-handler pools would multiply threads (and per-thread queues).
+_POOL_MAX_WORKERS = 4
+_POOL_MAX_PENDING = 2048
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+_pool_pending = threading.BoundedSemaphore(_POOL_MAX_PENDING)
+
+
+def _shared_pool() -> ThreadPoolExecutor:
+    """Return the module-wide pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=_POOL_MAX_WORKERS,
+                thread_name_prefix="ajt"
+            )
+    return _pool
+
+
+def _pool_task_done(future: Future) -> None:
+    _pool_pending.release()
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("AJT record failed", exc_info=future.exception())
+
+
+class AJTCallbackHandler(_AJTRecordMixin, BaseCallbackHandler):
     """
     LangChain callback handler that emits AJT-compliant logs.
 
@@ -33,17 +219,29 @@ class AJTCallbackHandler(BaseCallbackHandler):
         )
         llm = ChatOpenAI(callbacks=[handler])
         response = llm.invoke("Summarize this document")
+
+    By default the policy engine runs inline in on_llm_start, so the
+    decision is recorded before the LLM call proceeds.
+
+    With background=True, evaluation and logging run on a shared
+    module-level thread pool and on_llm_start returns immediately:
+    the LLM call may start before the decision is recorded, and YOUR
+    policy engine's evaluate() is called from several threads at once,
+    so it must be thread-safe. At most _POOL_MAX_PENDING tasks are
+    queued; beyond that the caller runs the task itself rather than
+    dropping an audit record. The timestamp is always taken in
+    on_llm_start, not when a worker runs.
     """
 
     def __init__(
         self,
         policy_engine: Any,  # YOUR policy decision logic
         session_id: str,
-        app_version: str = "1.0.0"
+        app_version: str = "1.0.0",
+        background: bool = False
     ):
-        self.policy_engine = policy_engine
-        self.session_id = session_id
-        self.app_version = app_version
+        super().__init__(policy_engine, session_id, app_version)
+        self.background = background
 
     def on_llm_start(
         self,
@@ -52,38 +250,88 @@ class AJTCallbackHandler(BaseCallbackHandler):
         **kwargs: Any
     ) -> None:
         """Called when LLM starts. Log AJT record."""
+        timestamp = utc_timestamp()
+        run_id = kwargs.get("run_id", "unknown")
 
-        # Extract model info
-        model_name = serialized.get("id", ["unknown"])[-1]
+        if self.background and _pool_pending.acquire(blocking=False):
+            future = _shared_pool().submit(
+                self._process, serialized, prompts[0], run_id, timestamp
+            )
+            future.add_done_callback(_pool_task_done)
+        else:
+            # Inline (the default), or backlog full: apply backpressure
+            # instead of losing the record
+            self._process(serialized, prompts[0], run_id, timestamp)
 
+    def _process(
+        self,
+        serialized: Dict[str, Any],
+        prompt: str,
+        run_id: Any,
+        timestamp: str
+    ) -> None:
         # Get decision from YOUR policy engine
         # (AJT doesn't make decisions - you do)
         policy_result = self.policy_engine.evaluate(
-            prompts[0],
+            prompt,
             session_id=self.session_id
         )
 
-        # Construct AJT log record
-        ajt_record = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "run_id": kwargs.get("run_id", "unknown"),
-            "model": model_name,
-            "decision": policy_result["decision"],  # From YOUR engine
-            "risk_level": policy_result["risk"],    # From YOUR engine
-            "human_in_loop": policy_result.get("human_required", False),
-            "policy_version": self.policy_engine.version,
-            "app_version": self.app_version,
-            "session_id": self.session_id
-        }
-
-        # Log as structured JSON (use structured logger in production)
-        logger.info(f"AJT: {ajt_record}")
+        self._log_record(serialized, policy_result, run_id, timestamp)
 
     def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
         """Called when LLM finishes. Optional: log completion."""
         pass
 
 
+class AsyncAJTCallbackHandler(_AJTRecordMixin, AsyncCallbackHandler):
+    """
+    Async variant for async chains (ainvoke / astream / LangGraph).
+
+    The sync policy engine runs in a worker thread so the event loop
+    keeps streaming tokens. Logging only enqueues, so it stays inline.
+
+    Usage:
+        handler = AsyncAJTCallbackHandler(
+            policy_engine=your_policy_engine,
+            session_id="user-session-123"
+        )
+        llm = ChatOpenAI(callbacks=[handler])
+        response = await llm.ainvoke("Summarize this document")
+    """
+
+    async def on_llm_start(
+        self,
+        serialized: Dict[str, Any],
+        prompts: List[str],
+        **kwargs: Any
+    ) -> None:
+        """Called when LLM starts. Log AJT record."""
+        timestamp = utc_timestamp()
+
+        # Prefer a native coroutine if YOUR engine provides one
+        aevaluate = getattr(self.policy_engine, "aevaluate", None)
+        if aevaluate is not None:
+            policy_result = await aevaluate(
+                prompts[0],
+                session_id=self.session_id
+            )
+        else:
+            policy_result = await asyncio.to_thread(
+                self.policy_engine.evaluate,
+                prompts[0],
+                session_id=self.session_id
+            )
+
+        self._log_record(
+            serialized, policy_result, kwargs.get("run_id", "unknown"), timestamp
+        )
+
+    async def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        """Called when LLM finishes. Optional: log completion."""
+        pass
+
+
 # Example policy engine (replace with YOUR logic)
 class ExamplePolicyEngine:
     """
@@ -93,6 +341,9 @@ class ExamplePolicyEngine:
     """
     version = "policy-v2.3"
 
+    # Compiled once; searched case-insensitively without copying the prompt
+    _RISK_RE = re.compile(r"delete\s+all", re.IGNORECASE)
+
     def evaluate(self, prompt: str, session_id: str) -> Dict[str, Any]:
         """
         YOUR decision logic here.
@@ -101,7 +352,7 @@ class ExamplePolicyEngine:
             dict with 'decision', 'risk', and optional 'human_required'
         """
         # Example: simple keyword check (replace with real logic)
-        if "delete all" in prompt.lower():
+        if self._RISK_RE.search(prompt):
             return {
                 "decision": "block",
                 "risk": "high",
@@ -5,11 +5,17 @@ Minimal AJT logging with standard library only.
 No frameworks, no dependencies.
 """
 
+import atexit
 import logging
+import logging.handlers
 import json
-from datetime import datetime, timezone
+import os
+import queue
+import threading
 from uuid import uuid4
 
+from ajt_fields import new_run_id, utc_timestamp
+
 # Configure standard Python logger
 logging.basicConfig(
     level=logging.INFO,
@@ -17,6 +23,87 @@ logging.basicConfig(
 )
 logger = logging.getLogger("ajt")
 
+# Hand records to a background listener so formatting and I/O
+# happen off the caller's thread. The listener writes through the
+# handler basicConfig just installed.
+_queue = queue.SimpleQueue()
+_queue_handler = logging.handlers.QueueHandler(_queue)
+logger.addHandler(_queue_handler)
+logger.propagate = False
+listener = logging.handlers.QueueListener(
+    _queue, *logging.getLogger().handlers, respect_handler_level=True
+)
+listener.start()
+atexit.register(listener.stop)
+
+
+def _emit(msg: str) -> None:
+    """Pass a finished line to the queue handler, skipping findCaller()."""
+    _queue_handler.handle(
+        logging.LogRecord(logger.name, logging.INFO, "", 0, msg, None, None)
+    )
+
+
+# Built once and reused for every record
+_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+
+def _positive_int_env(name: str, default: int) -> int:
+    """Read a positive integer setting from the environment."""
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise ValueError(f"{name} must be a positive integer, got {raw!r}")
+    return value
+
+
+# Micro-batching: records are buffered and handed to the log handler
+# every AJT_BATCH_SIZE records or AJT_BATCH_MS milliseconds, whichever
+# comes first.
+AJT_BATCH_SIZE = _positive_int_env("AJT_BATCH_SIZE", 64)
+AJT_BATCH_MS = _positive_int_env("AJT_BATCH_MS", 50)
+
+_buf = []
+_buf_lock = threading.Lock()
+_stop_flusher = threading.Event()
+
+
+def _flush() -> None:
+    """
+    Emit all buffered records, one LogRecord each.
+
+    Separate records keep any handler format prefix on every line.
+    """
+    with _buf_lock:
+        for line in _buf:
+            _emit(line)
+        _buf.clear()
+
+
+def _flush_periodically() -> None:
+    while not _stop_flusher.wait(AJT_BATCH_MS / 1000):
+        _flush()
+
+
+def _drain() -> None:
+    """Stop the flusher and emit whatever is still buffered."""
+    _stop_flusher.set()
+    _flusher.join()
+    _flush()
+
+
+_flusher = threading.Thread(
+    target=_flush_periodically, name="ajt-flush", daemon=True
+)
+_flusher.start()
+# Registered after listener.stop, so atexit runs it first
+atexit.register(_drain)
+
 
 def log_ai_judgment(
     model: str,
@@ -31,9 +118,12 @@ def log_ai_judgment(
 
     This is just a structured log line. No enforcement, no blocking.
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     ajt_record = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "run_id": str(uuid4()),
+        "timestamp": utc_timestamp(),
+        "run_id": new_run_id(),
         "model": model,
         "decision": decision,
         "risk_level": risk_level,
@@ -43,8 +133,12 @@ def log_ai_judgment(
         "session_id": session_id or str(uuid4())
     }
 
-    # Just log it
-    logger.info(json.dumps(ajt_record))
+    # Just log it (buffered; see _flush)
+    with _buf_lock:
+        _buf.append(_encode(ajt_record))
+        full = len(_buf) >= AJT_BATCH_SIZE
+    if full:
+        _flush()
 
 
 # Example usage
@@ -75,4 +169,4 @@ if __name__ == "__main__":
         policy_version="v1.0"
     )
 
-    print("\n✅ Three AJT records logged above")
+    print("\n✅ Three AJT records logged")
@@ -11,16 +11,33 @@ Run: python examples/run_ajt_demo.py
 """
 
 import json
-import uuid
-from datetime import datetime, timezone
+import os
+import sys
+import tempfile
 from pathlib import Path
+from typing import Iterable
+
+from ajt_fields import new_run_id, utc_timestamp
+
+# Shared by every event builder below
+DEMO_MODEL = "demo-agent"
+DEMO_POLICY_VERSION = "demo-v1.0"
+DEMO_APP_VERSION = "demo-0.1"
+
+# Built once and reused for every event
+_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+
+def _demo_session_id(timestamp: str) -> str:
+    """Build the demo session id; YYYYMMDD is sliced from the ISO timestamp."""
+    return f"demo-session-{timestamp[0:4]}{timestamp[5:7]}{timestamp[8:10]}"
 
 
 def create_ajt_event(
     decision: str,
     reason: str,
     risk_level: str = "medium",
-    model: str = "demo-agent",
+    model: str = DEMO_MODEL,
     human_in_loop: bool = False,
     context: dict = None
 ):
@@ -30,17 +47,19 @@ def create_ajt_event(
     AJT Principle: Record the judgment BEFORE execution.
     This is not retrospective logging - it's decision accountability.
     """
+    timestamp = utc_timestamp()
+
     return {
         # Required AJT v0.1 fields (9 total)
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "run_id": str(uuid.uuid4()),
+        "timestamp": timestamp,
+        "run_id": new_run_id(),
         "model": model,
         "decision": decision,
         "risk_level": risk_level,
         "human_in_loop": human_in_loop,
-        "policy_version": "demo-v1.0",
-        "app_version": "demo-0.1",
-        "session_id": f"demo-session-{datetime.now(timezone.utc).strftime('%Y%m%d')}",
+        "policy_version": DEMO_POLICY_VERSION,
+        "app_version": DEMO_APP_VERSION,
+        "session_id": _demo_session_id(timestamp),
 
         # Optional extensions (AJT allows additionalProperties)
         "reason": reason,
@@ -48,6 +67,49 @@ def create_ajt_event(
     }
 
 
+# Specialized forms of create_ajt_event for the demo's two fixed shapes:
+# straight-line dict literals, no keyword defaults to evaluate.
+def _ajt_stop(reason: str, risk_level: str, context: dict):
+    """AI-made STOP decision (no human in the loop)."""
+    timestamp = utc_timestamp()
+    return {
+        "timestamp": timestamp,
+        "run_id": new_run_id(),
+        "model": DEMO_MODEL,
+        "decision": "STOP",
+        "risk_level": risk_level,
+        "human_in_loop": False,
+        "policy_version": DEMO_POLICY_VERSION,
+        "app_version": DEMO_APP_VERSION,
+        "session_id": _demo_session_id(timestamp),
+        "reason": reason,
+        "context": context
+    }
+
+
+def _ajt_allow_human(reason: str, context: dict):
+    """High-risk ALLOW decision approved by a human."""
+    timestamp = utc_timestamp()
+    return {
+        "timestamp": timestamp,
+        "run_id": new_run_id(),
+        "model": DEMO_MODEL,
+        "decision": "ALLOW",
+        "risk_level": "high",
+        "human_in_loop": True,
+        "policy_version": DEMO_POLICY_VERSION,
+        "app_version": DEMO_APP_VERSION,
+        "session_id": _demo_session_id(timestamp),
+        "reason": reason,
+        "context": context
+    }
+
+
+def _write_lines(lines: list):
+    """Write a scenario's console output with a single write call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def scenario_hallucination_detection():
     """
     Scenario 1: AI generates content without citations.
@@ -55,19 +117,20 @@ def scenario_hallucination_detection():
 
     This demonstrates AJT's core value: explicit STOP decisions with reasons.
     """
-    print("\n" + "="*70)
-    print("SCENARIO 1: Hallucination Detection")
-    print("="*70)
-    print("An AI agent is about to generate a factual claim.")
-    print("AJT checks: Does it have citations?")
-    print()
+    lines = [
+        "\n" + "="*70,
+        "SCENARIO 1: Hallucination Detection",
+        "="*70,
+        "An AI agent is about to generate a factual claim.",
+        "AJT checks: Does it have citations?",
+        "",
+    ]
 
     # Simulate judgment
     has_citations = False  # Deterministic stub (no LLM needed)
 
     if not has_citations:
-        event = create_ajt_event(
-            decision="STOP",
+        event = _ajt_stop(
             reason="missing_citation",
             risk_level="high",
             context={
@@ -78,16 +141,20 @@ def scenario_hallucination_detection():
             }
         )
 
-        print(f"✋ Decision: {event['decision']}")
-        print(f"📋 Reason: {event['reason']}")
-        print(f"⚠️  Risk Level: {event['risk_level']}")
-        print(f"📌 Rule: {event['context']['rule_triggered']}")
-        print()
-        print("→ AI output blocked. No hallucination generated.")
+        lines += [
+            f"✋ Decision: {event['decision']}",
+            f"📋 Reason: {event['reason']}",
+            f"⚠️  Risk Level: {event['risk_level']}",
+            f"📌 Rule: {event['context']['rule_triggered']}",
+            "",
+            "→ AI output blocked. No hallucination generated.",
+        ]
+        _write_lines(lines)
 
         return event
 
     # This path not reached in demo (deterministic STOP)
+    _write_lines(lines)
     return None
 
 
@@ -98,35 +165,45 @@ def scenario_human_override():
 
     This demonstrates: AJT records WHO made the decision (human vs AI).
     """
-    print("\n" + "="*70)
-    print("SCENARIO 2: Human-in-the-Loop Override")
-    print("="*70)
-    print("AI detects high-risk operation (e.g., code execution).")
-    print("System routes to human for approval.")
-    print()
+    lines = [
+        "\n" + "="*70,
+        "SCENARIO 2: Human-in-the-Loop Override",
+        "="*70,
+        "AI detects high-risk operation (e.g., code execution).",
+        "System routes to human for approval.",
+        "",
+    ]
 
     # Simulate human approval
     human_approved = True  # Deterministic stub
 
-    event = create_ajt_event(
-        decision="ALLOW" if human_approved else "STOP",
-        reason="human_approved" if human_approved else "human_rejected",
-        risk_level="high",
-        human_in_loop=True,
-        context={
-            "scenario": "code_execution_demo",
-            "operation_type": "shell_command",
-            "reviewer": "demo_human",
-            "approval_timestamp": datetime.now(timezone.utc).isoformat()
-        }
-    )
+    context = {
+        "scenario": "code_execution_demo",
+        "operation_type": "shell_command",
+        "reviewer": "demo_human",
+        "approval_timestamp": utc_timestamp()
+    }
 
-    print(f"✅ Decision: {event['decision']}")
-    print(f"📋 Reason: {event['reason']}")
-    print(f"👤 Human in Loop: {event['human_in_loop']}")
-    print(f"⚠️  Risk Level: {event['risk_level']}")
-    print()
-    print("→ Operation allowed. Human accepted responsibility.")
+    if human_approved:
+        event = _ajt_allow_human(reason="human_approved", context=context)
+    else:
+        event = create_ajt_event(
+            decision="STOP",
+            reason="human_rejected",
+            risk_level="high",
+            human_in_loop=True,
+            context=context
+        )
+
+    lines += [
+        f"✅ Decision: {event['decision']}",
+        f"📋 Reason: {event['reason']}",
+        f"👤 Human in Loop: {event['human_in_loop']}",
+        f"⚠️  Risk Level: {event['risk_level']}",
+        "",
+        "→ Operation allowed. Human accepted responsibility.",
+    ]
+    _write_lines(lines)
 
     return event
 
@@ -139,19 +216,20 @@ def scenario_policy_compliance():
     This demonstrates: AJT tracks WHICH policy version was active.
     Post-incident analysis can show "this happened under old rules".
     """
-    print("\n" + "="*70)
-    print("SCENARIO 3: Policy Version Enforcement")
-    print("="*70)
-    print("AI request arrives with policy_version='v1.0'.")
-    print("Current policy is 'v2.0' (stricter rules).")
-    print()
+    lines = [
+        "\n" + "="*70,
+        "SCENARIO 3: Policy Version Enforcement",
+        "="*70,
+        "AI request arrives with policy_version='v1.0'.",
+        "Current policy is 'v2.0' (stricter rules).",
+        "",
+    ]
 
     request_policy = "v1.0"
     current_policy = "v2.0"
 
     if request_policy != current_policy:
-        event = create_ajt_event(
-            decision="STOP",
+        event = _ajt_stop(
             reason="policy_version_mismatch",
             risk_level="medium",
             context={
@@ -162,35 +240,86 @@ def scenario_policy_compliance():
             }
         )
 
-        print(f"✋ Decision: {event['decision']}")
-        print(f"📋 Reason: {event['reason']}")
-        print(f"📜 Requested Policy: {request_policy}")
-        print(f"📜 Current Policy: {current_policy}")
-        print()
-        print("→ Request rejected. Policy updated since request was made.")
+        lines += [
+            f"✋ Decision: {event['decision']}",
+            f"📋 Reason: {event['reason']}",
+            f"📜 Requested Policy: {request_policy}",
+            f"📜 Current Policy: {current_policy}",
+            "",
+            "→ Request rejected. Policy updated since request was made.",
+        ]
+        _write_lines(lines)
 
         return event
 
+    _write_lines(lines)
     return None
 
 
-def write_ajt_log(events: list, filepath: str = "ajt_trace.jsonl"):
+def write_ajt_log(
+    events: Iterable[dict],
+    filepath: str = "ajt_trace.jsonl",
+    verbose: bool = True
+):
     """
     Write AJT events to JSONL (JSON Lines) format.
 
+    The previous trace at filepath is only replaced once every event
+    has been written; if producing an event raises, it is left as is.
+
+    Pass verbose=False in a loop-driven writer to skip the summary
+    (and the getcwd() behind the absolute path it prints).
+
     Why JSONL?
     - One event per line (easy to grep/stream)
     - Compatible with log aggregators (Datadog, Splunk, etc.)
     - Can append without parsing entire file
     """
     output_path = Path(filepath)
-
-    with open(output_path, 'w') as f:
-        for event in events:
-            f.write(json.dumps(event, ensure_ascii=False) + '\n')
+    tmp_path = None
+
+    count = 0
+
+    # Events are consumed one at a time (constant memory); the 1 MiB
+    # write buffer still coalesces them into very few write() calls.
+    # An audit trail should survive a crash: fsync once for the whole
+    # batch rather than once per event
+    try:
+        # Events may be produced lazily, so build the trace in a uniquely
+        # named file next to the target and only replace the previous
+        # one once it is complete
+        fd, tmp_path = tempfile.mkstemp(
+            dir=output_path.parent, prefix=f".{output_path.name}."
+        )
+        os.chmod(tmp_path, 0o644)  # mkstemp creates files as 0o600
+        with os.fdopen(fd, 'wb', buffering=1 << 20) as f:
+            for event in events:
+                f.write(_encode(event).encode('utf-8'))
+                f.write(b'\n')
+                count += 1
+            f.flush()
+            os.fsync(fd)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        # A failed run leaves the existing trace untouched
+        if tmp_path is not None:
+            os.unlink(tmp_path)
+        raise
+
+    # The rename only survives a crash once the directory entry is on
+    # disk too (POSIX; directories cannot be opened this way on Windows)
+    if os.name == "posix":
+        dir_fd = os.open(output_path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    if not verbose:
+        return
 
     print(f"\n✅ AJT log written to: {output_path.absolute()}")
-    print(f"📊 Total events: {len(events)}")
+    print(f"📊 Total events: {count}")
     print()
     print("To view the log:")
     print(f"  cat {filepath}")
@@ -210,15 +339,15 @@ def main():
     print("No LLM required. No complex setup. Just judgment logging.")
     print("="*70)
 
-    events = []
-
-    # Run scenarios
-    events.append(scenario_hallucination_detection())
-    events.append(scenario_human_override())
-    events.append(scenario_policy_compliance())
+    scenarios = (
+        scenario_hallucination_detection,
+        scenario_human_override,
+        scenario_policy_compliance,
+    )
 
-    # Filter None events (defensive)
-    events = [e for e in events if e is not None]
+    # Run scenarios lazily as the log is written
+    # (None events are filtered - defensive)
+    events = filter(None, (run() for run in scenarios))
 
     # Write log
     write_ajt_log(events)